@@ -72,9 +72,9 @@ public sealed record ClipboardContent
     };
     
     /// <summary>
-    /// Creates empty clipboard content
+    /// Shared empty clipboard content; the record is immutable so one instance serves every caller
     /// </summary>
-    public static ClipboardContent Empty => new() { Type = ClipboardContentType.None };
+    public static ClipboardContent Empty { get; } = new() { Type = ClipboardContentType.None };
     
     /// <summary>
     /// Creates text clipboard content
@@ -16,15 +16,27 @@ public sealed class ClipboardChangedEventArgs(ClipboardContent content) : EventA
 /// </summary>
 public sealed class ClipboardMonitor : IDisposable
 {
+    // Debounce settings to prevent multiple events for single clipboard operation
+    private static readonly TimeSpan DebounceDelay = TimeSpan.FromMilliseconds(100);
+    
+    // How long Start waits for the message thread to create its window
+    private static readonly TimeSpan WindowCreateTimeout = TimeSpan.FromSeconds(5);
+    
+    // How long Stop waits for the message thread to unregister and exit
+    private static readonly TimeSpan ThreadStopTimeout = TimeSpan.FromSeconds(1);
+    
     private readonly Logger _logger = Logger.Instance;
     private readonly Thread _messageThread;
     private readonly ManualResetEventSlim _windowCreated = new();
     
-    // Debounce settings to prevent multiple events for single clipboard operation
-    private readonly TimeSpan _debounceDelay = TimeSpan.FromMilliseconds(100);
-    private Timer? _debounceTimer;
+    private readonly Timer _debounceTimer;
     private readonly object _debounceLock = new();
     private volatile bool _pendingUpdate;
+    private bool _updateRunning;
+    private volatile bool _stopping;
+    
+    // Sequence number of the last clipboard state that was read; unchanged means nothing new to read
+    private uint _lastSequenceNumber;
     
     private nint _hwnd;
     private bool _disposed;
@@ -39,6 +51,9 @@ public sealed class ClipboardMonitor : IDisposable
             IsBackground = true,
             Name = "ClipboardMonitor"
         };
+        
+        // Created once, disarmed; each clipboard notification re-arms it
+        _debounceTimer = new Timer(_ => ProcessDebouncedUpdate(), null, Timeout.Infinite, Timeout.Infinite);
     }
     
     /// <summary>
@@ -52,7 +67,7 @@ public sealed class ClipboardMonitor : IDisposable
         _messageThread.Start();
         
         // Wait for window creation
-        if (!_windowCreated.Wait(TimeSpan.FromSeconds(5)))
+        if (!_windowCreated.Wait(WindowCreateTimeout))
         {
             throw new InvalidOperationException("Failed to create clipboard monitor window");
         }
@@ -65,10 +80,26 @@ public sealed class ClipboardMonitor : IDisposable
     /// </summary>
     public void Stop()
     {
+        // Drop any debounced update and refuse new ones, so no read starts after shutdown begins;
+        // a notification dispatched before WM_QUIT would otherwise re-arm the timer
+        lock (_debounceLock)
+        {
+            _stopping = true;
+            _pendingUpdate = false;
+            if (!_disposed)
+                _debounceTimer.Change(Timeout.Infinite, Timeout.Infinite);
+        }
+        
         if (_hwnd != nint.Zero)
         {
             NativeMethods.PostMessageW(_hwnd, NativeMethods.WM_QUIT, nint.Zero, nint.Zero);
         }
+        
+        // The loop exits as soon as it sees WM_QUIT; wait so the listener is gone when Stop returns
+        if (_messageThread.IsAlive && Thread.CurrentThread != _messageThread)
+        {
+            _messageThread.Join(ThreadStopTimeout);
+        }
     }
     
     private void MessageLoop()
@@ -164,15 +195,12 @@ public sealed class ClipboardMonitor : IDisposable
     {
         lock (_debounceLock)
         {
+            if (_disposed || _stopping) return;
+            
             _pendingUpdate = true;
             
-            // Reset the timer each time we get an update
-            _debounceTimer?.Dispose();
-            _debounceTimer = new Timer(
-                _ => ProcessDebouncedUpdate(),
-                null,
-                _debounceDelay,
-                Timeout.InfiniteTimeSpan);
+            // Push the deadline back each time we get an update
+            _debounceTimer.Change(DebounceDelay, Timeout.InfiniteTimeSpan);
         }
     }
     
@@ -183,20 +211,58 @@ public sealed class ClipboardMonitor : IDisposable
     {
         lock (_debounceLock)
         {
-            if (!_pendingUpdate) return;
+            if (!_pendingUpdate || _disposed || _stopping) return;
+            
+            // A slow read (large image or file) is still in flight; check again after another
+            // debounce period instead of starting a second read alongside it
+            if (_updateRunning)
+            {
+                _debounceTimer.Change(DebounceDelay, Timeout.InfiniteTimeSpan);
+                return;
+            }
+            
             _pendingUpdate = false;
+            _updateRunning = true;
         }
         
-        OnClipboardUpdate();
+        try
+        {
+            OnClipboardUpdate();
+        }
+        finally
+        {
+            lock (_debounceLock)
+            {
+                _updateRunning = false;
+            }
+        }
     }
     
     private void OnClipboardUpdate()
     {
+        // The counter is bumped on every real clipboard write; a notification without a new
+        // sequence number carries no new content, so skip opening and reading the clipboard
+        // Zero means the number is unavailable, in which case always read
+        var sequenceNumber = NativeMethods.GetClipboardSequenceNumber();
+        if (sequenceNumber != 0 && sequenceNumber == _lastSequenceNumber)
+            return;
+        
+        _lastSequenceNumber = sequenceNumber;
+        
+        // Our own write of content received from the partner; reading it back would only
+        // rebuild what we just wrote for ContentTracker to suppress
+        if (sequenceNumber != 0 && sequenceNumber == ClipboardWriter.LastWriteSequenceNumber)
+        {
+            _logger.Debug("CLIPBOARD", "Skipping own clipboard write");
+            return;
+        }
+        
         try
         {
             var content = ClipboardReader.Read();
             
-            if (content.Type != ClipboardContentType.None)
+            // A read already in flight when Stop was called must not report after it returns
+            if (content.Type != ClipboardContentType.None && !_stopping)
             {
                 ClipboardChanged?.Invoke(this, new ClipboardChangedEventArgs(content));
             }
@@ -216,8 +282,7 @@ public sealed class ClipboardMonitor : IDisposable
         
         lock (_debounceLock)
         {
-            _debounceTimer?.Dispose();
-            _debounceTimer = null;
+            _debounceTimer.Dispose();
         }
         
         _windowCreated.Dispose();
@@ -22,18 +22,31 @@ public static class ClipboardReader
             return ClipboardContent.Empty;
         }
 
+        ClipboardContent content;
+        byte[]? dibData;
         try
         {
-            return ReadInternal();
+            content = ReadInternal(out dibData);
         }
         finally
         {
             NativeMethods.CloseClipboard();
         }
+
+        // Only the raw bitmap bytes or the dropped path are taken while the clipboard is open;
+        // PNG encoding and file loading happen afterwards so other applications are not locked out
+        if (dibData is not null)
+            return ReadImage(dibData);
+
+        return content is { Type: ClipboardContentType.File, FileData: null, FilePath: { } path }
+            ? ReadFile(path)
+            : content;
     }
 
-    private static ClipboardContent ReadInternal()
+    private static ClipboardContent ReadInternal(out byte[]? dibData)
     {
+        dibData = null;
+
         // Check for files first (HDROP)
         if (NativeMethods.IsClipboardFormatAvailable(NativeMethods.CF_HDROP))
         {
@@ -44,7 +57,8 @@ public static class ClipboardReader
         if (NativeMethods.IsClipboardFormatAvailable(NativeMethods.CF_DIBV5) ||
             NativeMethods.IsClipboardFormatAvailable(NativeMethods.CF_DIB))
         {
-            return ReadImage();
+            dibData = CopyDib();
+            return ClipboardContent.Empty;
         }
 
         // Check for text
@@ -61,7 +75,7 @@ public static class ClipboardReader
         return ClipboardContent.Empty;
     }
 
-    private static ClipboardContent ReadFiles()
+    private static unsafe ClipboardContent ReadFiles()
     {
         var hDrop = NativeMethods.GetClipboardData(NativeMethods.CF_HDROP);
         if (hDrop == nint.Zero)
@@ -79,11 +93,20 @@ public static class ClipboardReader
             return new ClipboardContent { Type = ClipboardContentType.MultipleFiles };
         }
 
-        // Get first file path
-        var buffer = new char[260];
-        uint len = NativeMethods.DragQueryFileW(hDrop, 0, buffer, 260);
-        var path = new string(buffer, 0, (int)len);
+        // Get first file path; query its length first so long paths are not truncated
+        uint len = NativeMethods.DragQueryFileW(hDrop, 0, null, 0);
+        Span<char> buffer = len < 260 ? stackalloc char[260] : new char[len + 1];
+        fixed (char* p = buffer)
+        {
+            len = NativeMethods.DragQueryFileW(hDrop, 0, p, (uint)buffer.Length);
+        }
+        var path = new string(buffer[..(int)len]);
+
+        return new ClipboardContent { Type = ClipboardContentType.File, FilePath = path };
+    }
 
+    private static ClipboardContent ReadFile(string path)
+    {
         // Check if it's a directory
         if (Directory.Exists(path))
         {
@@ -111,7 +134,7 @@ public static class ClipboardReader
         }
     }
 
-    private static ClipboardContent ReadImage()
+    private static byte[]? CopyDib()
     {
         uint format = NativeMethods.IsClipboardFormatAvailable(NativeMethods.CF_DIBV5)
             ? NativeMethods.CF_DIBV5
@@ -119,29 +142,17 @@ public static class ClipboardReader
 
         var hData = NativeMethods.GetClipboardData(format);
         if (hData == nint.Zero)
-            return ClipboardContent.Empty;
+            return null;
 
         var ptr = NativeMethods.GlobalLock(hData);
         if (ptr == nint.Zero)
-            return ClipboardContent.Empty;
+            return null;
 
         try
         {
-            var size = (int)NativeMethods.GlobalSize(hData);
-            
-            // Read BITMAPINFOHEADER
-            var header = Marshal.PtrToStructure<NativeMethods.BITMAPINFOHEADER>(ptr);
-            int width = header.biWidth;
-            int height = Math.Abs(header.biHeight);
-            int bitCount = header.biBitCount;
-
-            // Convert DIB to PNG
-            var pngData = ConvertDibToPng(ptr, size, width, height, bitCount);
-            
-            if (pngData is null)
-                return ClipboardContent.Empty;
-
-            return ClipboardContent.FromImage(pngData, width, height);
+            var dibData = new byte[(int)NativeMethods.GlobalSize(hData)];
+            Marshal.Copy(ptr, dibData, 0, dibData.Length);
+            return dibData;
         }
         finally
         {
@@ -149,13 +160,31 @@ public static class ClipboardReader
         }
     }
 
-    private static byte[]? ConvertDibToPng(nint dibPtr, int dibSize, int width, int height, int bitCount)
+    private static ClipboardContent ReadImage(byte[] dibData)
+    {
+        if (dibData.Length < Marshal.SizeOf<NativeMethods.BITMAPINFOHEADER>())
+            return ClipboardContent.Empty;
+
+        // Read BITMAPINFOHEADER
+        var header = MemoryMarshal.Read<NativeMethods.BITMAPINFOHEADER>(dibData);
+        int width = header.biWidth;
+        int height = Math.Abs(header.biHeight);
+        int bitCount = header.biBitCount;
+
+        // Convert DIB to PNG
+        var pngData = ConvertDibToPng(dibData, width, height, bitCount);
+        
+        if (pngData is null)
+            return ClipboardContent.Empty;
+
+        return ClipboardContent.FromImage(pngData, width, height);
+    }
+
+    private static byte[]? ConvertDibToPng(byte[] dibData, int width, int height, int bitCount)
     {
         try
         {
-            // Read DIB data
-            byte[] dibData = new byte[dibSize];
-            Marshal.Copy(dibPtr, dibData, 0, dibSize);
+            int dibSize = dibData.Length;
 
             // Calculate offsets
             int headerSize = Marshal.SizeOf<NativeMethods.BITMAPINFOHEADER>();
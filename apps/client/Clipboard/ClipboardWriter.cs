@@ -9,6 +9,12 @@ namespace WSClip.Clipboard;
 public static class ClipboardWriter
 {
     private static readonly Logger _logger = Logger.Instance;
+    private static uint _lastWriteSequenceNumber;
+
+    /// <summary>
+    /// Clipboard sequence number left behind by the most recent successful write
+    /// </summary>
+    public static uint LastWriteSequenceNumber => Volatile.Read(ref _lastWriteSequenceNumber);
 
     /// <summary>
     /// Writes text to clipboard
@@ -18,6 +24,9 @@ public static class ClipboardWriter
         if (string.IsNullOrEmpty(text))
             return false;
 
+        // Encode before taking the clipboard so it stays open only for the handoff
+        var bytes = System.Text.Encoding.Unicode.GetBytes(text + "\0");
+
         if (!NativeMethods.OpenClipboard(nint.Zero))
         {
             _logger.Debug("CLIPBOARD", "Failed to open clipboard for writing");
@@ -28,7 +37,6 @@ public static class ClipboardWriter
         {
             NativeMethods.EmptyClipboard();
 
-            var bytes = System.Text.Encoding.Unicode.GetBytes(text + "\0");
             var hGlobal = NativeMethods.GlobalAlloc(NativeMethods.GHND, (nuint)bytes.Length);
             
             if (hGlobal == nint.Zero)
@@ -60,6 +68,7 @@ public static class ClipboardWriter
                 return false;
             }
 
+            RecordWrite();
             return true;
         }
         finally
@@ -76,21 +85,26 @@ public static class ClipboardWriter
         if (pngData is null || pngData.Length == 0)
             return false;
 
+        byte[]? dibData;
         try
         {
+            // Decode and convert before taking the clipboard; other applications are
+            // locked out of it while it is open, and a failed conversion leaves it untouched
             using var pngStream = new MemoryStream(pngData);
             using var bitmap = new System.Drawing.Bitmap(pngStream);
             
-            return WriteImageBitmap(bitmap);
+            dibData = BitmapToDib(bitmap);
         }
         catch (Exception ex)
         {
             _logger.Debug("CLIPBOARD", $"Failed to write image: {ex.Message}");
             return false;
         }
+
+        return dibData is not null && WriteDib(dibData);
     }
 
-    private static bool WriteImageBitmap(System.Drawing.Bitmap bitmap)
+    private static bool WriteDib(byte[] dibData)
     {
         if (!NativeMethods.OpenClipboard(nint.Zero))
         {
@@ -102,11 +116,6 @@ public static class ClipboardWriter
         {
             NativeMethods.EmptyClipboard();
 
-            // Convert bitmap to DIB
-            var dibData = BitmapToDib(bitmap);
-            if (dibData is null)
-                return false;
-
             var hGlobal = NativeMethods.GlobalAlloc(NativeMethods.GHND, (nuint)dibData.Length);
             if (hGlobal == nint.Zero)
                 return false;
@@ -133,6 +142,7 @@ public static class ClipboardWriter
                 return false;
             }
 
+            RecordWrite();
             return true;
         }
         finally
@@ -141,6 +151,12 @@ public static class ClipboardWriter
         }
     }
 
+    private static void RecordWrite()
+    {
+        // Read while the clipboard is still open, so no other writer can have bumped it yet
+        Volatile.Write(ref _lastWriteSequenceNumber, NativeMethods.GetClipboardSequenceNumber());
+    }
+
     private static byte[]? BitmapToDib(System.Drawing.Bitmap bitmap)
     {
         try
@@ -282,6 +298,7 @@ public static class ClipboardWriter
                 return false;
             }
 
+            RecordWrite();
             return true;
         }
         finally
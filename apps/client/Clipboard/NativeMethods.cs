@@ -120,9 +120,9 @@ internal static partial class NativeMethods
 
     #region Shell32.dll
 
-    // Use DllImport for DragQueryFileW since it has complex marshalling
-    [DllImport("shell32.dll", SetLastError = true, CharSet = CharSet.Unicode)]
-    public static extern uint DragQueryFileW(nint hDrop, uint iFile, char[]? lpszFile, uint cch);
+    // Takes a raw buffer so callers can pass stack memory without any marshalling
+    [LibraryImport("shell32.dll", SetLastError = true)]
+    public static unsafe partial uint DragQueryFileW(nint hDrop, uint iFile, char* lpszFile, uint cch);
 
     #endregion
 
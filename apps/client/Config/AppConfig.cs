@@ -22,6 +22,11 @@ public sealed record ProxyConfig
 /// </summary>
 public sealed record AppConfig
 {
+    /// <summary>
+    /// Default maximum content size in bytes (20MB)
+    /// </summary>
+    public const long DefaultMaxContentSize = 20 * 1024 * 1024;
+    
     [JsonPropertyName("serverUrl")]
     public string ServerUrl { get; init; } = "";
     
@@ -35,7 +40,10 @@ public sealed record AppConfig
     public string ConnectionId { get; init; } = "";
     
     [JsonPropertyName("maxContentSize")]
-    public long MaxContentSize { get; init; } = 20 * 1024 * 1024; // 20MB default
+    public long MaxContentSize { get; init; } = DefaultMaxContentSize;
+    
+    [JsonPropertyName("compression")]
+    public bool Compression { get; init; } = true;
     
     [JsonPropertyName("proxy")]
     public ProxyConfig? Proxy { get; init; }
@@ -44,7 +52,11 @@ public sealed record AppConfig
     /// Gets the WebSocket URL from the server URL
     /// </summary>
     [JsonIgnore]
-    public string WebSocketUrl => ServerUrl
-        .Replace("https://", "wss://")
-        .Replace("http://", "ws://");
+    public string WebSocketUrl => ServerUrl switch
+    {
+        // Only the leading scheme is swapped; the rest of the URL is left untouched
+        var url when url.StartsWith("https://", StringComparison.OrdinalIgnoreCase) => string.Concat("wss://", url.AsSpan("https://".Length)),
+        var url when url.StartsWith("http://", StringComparison.OrdinalIgnoreCase) => string.Concat("ws://", url.AsSpan("http://".Length)),
+        var url => url
+    };
 }
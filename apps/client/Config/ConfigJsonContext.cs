@@ -0,0 +1,12 @@
+using System.Text.Json.Serialization;
+
+namespace WSClip.Config;
+
+/// <summary>
+/// Compile-time generated JSON metadata for configuration files
+/// </summary>
+[JsonSourceGenerationOptions(WriteIndented = true)]
+[JsonSerializable(typeof(AppConfig))]
+internal sealed partial class ConfigJsonContext : JsonSerializerContext
+{
+}
@@ -1,3 +1,4 @@
+using System.Text;
 using System.Text.Json;
 
 namespace WSClip.Config;
@@ -7,20 +8,14 @@ namespace WSClip.Config;
 /// </summary>
 public static class ConfigLoader
 {
-    private static readonly JsonSerializerOptions JsonOptions = new()
-    {
-        WriteIndented = true,
-        PropertyNamingPolicy = JsonNamingPolicy.CamelCase
-    };
+    // The profile folder does not change while the process runs; resolve it once
+    private static readonly string DefaultConfigPath = Path.Combine(
+        Environment.GetFolderPath(Environment.SpecialFolder.UserProfile), ".config", "wsclip", "config.json");
     
     /// <summary>
     /// Gets the default configuration file path following XDG standard
     /// </summary>
-    public static string GetDefaultConfigPath()
-    {
-        var userProfile = Environment.GetFolderPath(Environment.SpecialFolder.UserProfile);
-        return Path.Combine(userProfile, ".config", "wsclip", "config.json");
-    }
+    public static string GetDefaultConfigPath() => DefaultConfigPath;
     
     /// <summary>
     /// Loads configuration from the specified path
@@ -30,8 +25,14 @@ public static class ConfigLoader
         if (!File.Exists(path))
             return null;
         
-        await using var stream = File.OpenRead(path);
-        return await JsonSerializer.DeserializeAsync<AppConfig>(stream, JsonOptions);
+        // The file is small; read it in one call and parse the bytes directly instead of streaming
+        ReadOnlyMemory<byte> json = await File.ReadAllBytesAsync(path);
+        
+        // Editors such as Notepad and PowerShell 5 prepend a UTF-8 BOM; the byte parser rejects it
+        if (json.Span.StartsWith(Encoding.UTF8.Preamble))
+            json = json[Encoding.UTF8.Preamble.Length..];
+        
+        return JsonSerializer.Deserialize(json.Span, ConfigJsonContext.Default.AppConfig);
     }
     
     /// <summary>
@@ -40,10 +41,14 @@ public static class ConfigLoader
     public static async Task SaveAsync(string path, AppConfig config)
     {
         var directory = Path.GetDirectoryName(path);
-        if (!string.IsNullOrEmpty(directory) && !Directory.Exists(directory))
-            Directory.CreateDirectory(directory);
+        if (!string.IsNullOrEmpty(directory))
+            Directory.CreateDirectory(directory); // no-op when it already exists
         
-        await using var stream = File.Create(path);
-        await JsonSerializer.SerializeAsync(stream, config, JsonOptions);
+        // Write the whole document to a sibling temp file, then swap it in, so a
+        // crash mid-write never leaves a truncated config behind
+        var json = JsonSerializer.SerializeToUtf8Bytes(config, ConfigJsonContext.Default.AppConfig);
+        var tempPath = path + ".tmp";
+        await File.WriteAllBytesAsync(tempPath, json);
+        File.Move(tempPath, path, overwrite: true);
     }
 }
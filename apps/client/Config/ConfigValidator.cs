@@ -5,7 +5,7 @@ namespace WSClip.Config;
 /// <summary>
 /// Configuration validation result
 /// </summary>
-public sealed record ValidationResult(bool IsValid, string? ErrorMessage = null)
+public readonly record struct ValidationResult(bool IsValid, string? ErrorMessage = null)
 {
     public static ValidationResult Success => new(true);
     public static ValidationResult Failure(string message) => new(false, message);
@@ -31,7 +31,7 @@ public static partial class ConfigValidator
         if (string.IsNullOrWhiteSpace(config.ServerUrl))
             return ValidationResult.Failure("serverUrl cannot be empty");
         
-        if (!ServerUrlRegex().IsMatch(config.ServerUrl))
+        if (!IsValidServerUrl(config.ServerUrl))
             return ValidationResult.Failure("serverUrl must start with ws:// or wss://");
         
         // Secret validation
@@ -42,7 +42,7 @@ public static partial class ConfigValidator
         if (string.IsNullOrWhiteSpace(config.SessionId))
             return ValidationResult.Failure("sessionId cannot be empty");
         
-        if (!SessionIdRegex().IsMatch(config.SessionId))
+        if (!IsValidSessionId(config.SessionId))
             return ValidationResult.Failure("sessionId must be exactly 8 alphanumeric characters");
         
         // Connection ID validation
@@ -54,18 +54,28 @@ public static partial class ConfigValidator
             return ValidationResult.Failure("maxContentSize must be positive");
         
         // Proxy validation (if enabled)
-        if (config.Proxy is { Enabled: true })
+        if (config.Proxy is { Enabled: true } proxy)
         {
-            if (string.IsNullOrWhiteSpace(config.Proxy.Host))
+            if (string.IsNullOrWhiteSpace(proxy.Host))
                 return ValidationResult.Failure("proxy.host cannot be empty when proxy is enabled");
             
-            if (config.Proxy.Port is <= 0 or > 65535)
+            if (proxy.Port is <= 0 or > 65535)
                 return ValidationResult.Failure("proxy.port must be between 1 and 65535");
         }
         
         return ValidationResult.Success;
     }
     
+    /// <summary>
+    /// Checks whether a server URL uses the ws:// or wss:// scheme
+    /// </summary>
+    public static bool IsValidServerUrl(string serverUrl) => ServerUrlRegex().IsMatch(serverUrl);
+    
+    /// <summary>
+    /// Checks whether a session ID is exactly 8 alphanumeric characters
+    /// </summary>
+    public static bool IsValidSessionId(string sessionId) => SessionIdRegex().IsMatch(sessionId);
+    
     /// <summary>
     /// Generates a random session ID (8 alphanumeric characters)
     /// </summary>
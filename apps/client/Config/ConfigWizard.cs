@@ -10,15 +10,17 @@ public static class ConfigWizard
     /// </summary>
     public static async Task<AppConfig> RunAsync(string configPath)
     {
-        Console.WriteLine("Welcome to WSClip!");
-        Console.WriteLine();
-        Console.WriteLine("No configuration found. Let's set up your sync client.");
-        Console.WriteLine();
+        Console.Write("""
+            Welcome to WSClip!
+
+            No configuration found. Let's set up your sync client.
+
+
+            """.ReplaceLineEndings());
         
         // Server URL
         var serverUrl = Prompt("Server URL (e.g., wss://example.com:3000): ");
-        while (string.IsNullOrWhiteSpace(serverUrl) || 
-               (!serverUrl.StartsWith("ws://") && !serverUrl.StartsWith("wss://")))
+        while (!ConfigValidator.IsValidServerUrl(serverUrl))
         {
             Console.WriteLine("Error: URL must start with ws:// or wss://");
             serverUrl = Prompt("Server URL: ");
@@ -33,20 +35,16 @@ public static class ConfigWizard
         }
         
         // Session ID
-        var defaultSessionId = ConfigValidator.GenerateSessionId();
-        var sessionIdInput = Prompt($"Session ID (press Enter for \"{defaultSessionId}\"): ");
-        var sessionId = string.IsNullOrWhiteSpace(sessionIdInput) ? defaultSessionId : sessionIdInput;
+        var sessionId = PromptWithDefault("Session ID", ConfigValidator.GenerateSessionId());
         
-        while (!System.Text.RegularExpressions.Regex.IsMatch(sessionId, @"^[a-zA-Z0-9]{8}$"))
+        while (!ConfigValidator.IsValidSessionId(sessionId))
         {
             Console.WriteLine("Error: Session ID must be exactly 8 alphanumeric characters");
             sessionId = Prompt("Session ID: ");
         }
         
         // Connection ID
-        var hostname = Environment.MachineName;
-        var connectionIdInput = Prompt($"Device name (press Enter for \"{hostname}\"): ");
-        var connectionId = string.IsNullOrWhiteSpace(connectionIdInput) ? hostname : connectionIdInput;
+        var connectionId = PromptWithDefault("Device name", Environment.MachineName);
         
         // Proxy configuration
         ProxyConfig? proxyConfig = null;
@@ -54,11 +52,10 @@ public static class ConfigWizard
         
         if (useProxy)
         {
-            var proxyHost = Prompt("Proxy host (press Enter for \"localhost\"): ");
-            if (string.IsNullOrWhiteSpace(proxyHost)) proxyHost = "localhost";
-            
-            var proxyPortStr = Prompt("Proxy port (press Enter for \"9999\"): ");
-            var proxyPort = string.IsNullOrWhiteSpace(proxyPortStr) ? 9999 : int.Parse(proxyPortStr);
+            // Defaults come from the config model so the wizard and the schema cannot drift
+            var proxyDefaults = new ProxyConfig();
+            var proxyHost = PromptWithDefault("Proxy host", proxyDefaults.Host);
+            var proxyPort = PromptPort("Proxy port", proxyDefaults.Port);
             
             proxyConfig = new ProxyConfig
             {
@@ -74,15 +71,18 @@ public static class ConfigWizard
             Secret = secret,
             SessionId = sessionId,
             ConnectionId = connectionId,
-            MaxContentSize = 20 * 1024 * 1024, // 20MB default
+            MaxContentSize = AppConfig.DefaultMaxContentSize,
             Proxy = proxyConfig
         };
         
         await ConfigLoader.SaveAsync(configPath, config);
         
-        Console.WriteLine();
-        Console.WriteLine($"Configuration saved to {configPath}");
-        Console.WriteLine();
+        Console.Write($"""
+
+            Configuration saved to {configPath}
+
+
+            """.ReplaceLineEndings());
         
         return config;
     }
@@ -93,6 +93,12 @@ public static class ConfigWizard
         return Console.ReadLine()?.Trim() ?? "";
     }
     
+    private static string PromptWithDefault(string label, string defaultValue)
+    {
+        var input = Prompt($"{label} (press Enter for \"{defaultValue}\"): ");
+        return string.IsNullOrWhiteSpace(input) ? defaultValue : input;
+    }
+    
     private static string PromptSecret(string message)
     {
         Console.Write(message);
@@ -121,17 +127,36 @@ public static class ConfigWizard
         return secret.ToString();
     }
     
+    private static int PromptPort(string label, int defaultValue)
+    {
+        while (true)
+        {
+            var input = PromptWithDefault(label, defaultValue.ToString());
+            if (int.TryParse(input, out var port) && port is > 0 and <= 65535)
+                return port;
+            
+            Console.WriteLine("Error: Port must be a number between 1 and 65535");
+        }
+    }
+    
     private static bool PromptYesNo(string message, bool defaultYes)
     {
-        Console.Write(message);
-        var input = Console.ReadLine()?.Trim().ToLowerInvariant() ?? "";
-        
-        return input switch
+        while (true)
         {
-            "y" or "yes" => true,
-            "n" or "no" => false,
-            "" => defaultYes,
-            _ => defaultYes
-        };
+            var input = Prompt(message).ToLowerInvariant();
+            
+            switch (input)
+            {
+                case "y" or "yes":
+                    return true;
+                case "n" or "no":
+                    return false;
+                case "":
+                    return defaultYes;
+            }
+            
+            // A typo is not silently taken as the default
+            Console.WriteLine("Error: Please answer y or n");
+        }
     }
 }
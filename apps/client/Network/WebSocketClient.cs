@@ -1,6 +1,8 @@
+using System.Buffers;
+using System.Collections.Frozen;
 using System.Net.Sockets;
 using System.Net.WebSockets;
-using System.Text;
+using System.Text.Json;
 using WSClip.Config;
 using WSClip.Protocol;
 using WSClip.Utils;
@@ -50,15 +52,37 @@ public sealed class PartnerChangedEventArgs(string connectionId, bool connected)
 /// </summary>
 public sealed class WebSocketClient : IAsyncDisposable
 {
+    private const int ReceiveBufferSize = 64 * 1024; // 64KB
+    
+    // Below this size deflate framing costs more than it saves
+    private const int MinCompressedMessageSize = 256;
+    
+    // The send buffer is kept between sends up to this size; larger ones (images, files) are released
+    private const int SendBufferSize = 4 * 1024;
+    private const int MaxRetainedSendBufferSize = 64 * 1024;
+    
+    // Server error codes that need user intervention and are never retried (spec section 4.4)
+    private static readonly FrozenSet<string> FatalErrorCodes =
+        new[] { "INVALID_SECRET", "SESSION_FULL", "DUPLICATE_CONNECTION_ID" }.ToFrozenSet(StringComparer.Ordinal);
+    
     private readonly AppConfig _config;
+    private readonly Uri _uri;
     private readonly Logger _logger = Logger.Instance;
     private readonly BackoffCalculator _backoff = new();
     private readonly Lock _stateLock = new();
+    private readonly HttpMessageInvoker? _proxyInvoker;
+    
+    // ClientWebSocket allows one send at a time; the gate also protects the reusable send buffer
+    private readonly SemaphoreSlim _sendLock = new(1, 1);
+    private readonly Utf8JsonWriter _sendWriter;
+    private ArrayBufferWriter<byte> _sendBuffer = new(SendBufferSize);
     
     private ClientWebSocket? _webSocket;
     private CancellationTokenSource? _cts;
-    private Task? _receiveTask;
-    private Socket? _proxySocket;
+    private Task? _connectionTask;
+    
+    // Faulted when a fatal error ends an established connection; the owner must exit (spec section 4.4)
+    private readonly TaskCompletionSource _fatalError = new(TaskCreationOptions.RunContinuationsAsynchronously);
     
     private AppState _state = AppState.Disconnected;
     private string? _partnerId;
@@ -82,6 +106,12 @@ public sealed class WebSocketClient : IAsyncDisposable
     public string? PartnerId => _partnerId;
     public bool IsConnected => State is AppState.WaitingForPartner or AppState.SyncActive;
     public bool CanSync => State == AppState.SyncActive;
+    private bool IsConnectionOpen => _webSocket?.State == WebSocketState.Open;
+    
+    /// <summary>
+    /// Faults with the fatal error that ended the connection after it was established; never completes otherwise
+    /// </summary>
+    public Task FatalError => _fatalError.Task;
     
     public event EventHandler<StateChangedEventArgs>? StateChanged;
     public event EventHandler<MessageReceivedEventArgs>? MessageReceived;
@@ -90,6 +120,33 @@ public sealed class WebSocketClient : IAsyncDisposable
     public WebSocketClient(AppConfig config)
     {
         _config = config;
+        
+        // Connection parameters never change for a client; build the endpoint once for all reconnects
+        _uri = new Uri($"{config.WebSocketUrl}/ws?sessionId={config.SessionId}&connectionId={config.ConnectionId}&secret={config.Secret}");
+        _sendWriter = new Utf8JsonWriter(_sendBuffer);
+        
+        if (config.Proxy is { Enabled: true })
+        {
+            _proxyInvoker = CreateProxyInvoker(config.Proxy);
+        }
+    }
+    
+    /// <summary>
+    /// Builds the HTTP invoker used for every proxied connect; each new connection is tunneled through SOCKS5
+    /// </summary>
+    private static HttpMessageInvoker CreateProxyInvoker(ProxyConfig proxy)
+    {
+        var connector = new Socks5Connector(proxy);
+        var handler = new SocketsHttpHandler
+        {
+            ConnectCallback = async (context, cancellationToken) =>
+            {
+                var socket = await connector.ConnectAsync(context.DnsEndPoint.Host, context.DnsEndPoint.Port, cancellationToken);
+                return new NetworkStream(socket, ownsSocket: true);
+            }
+        };
+        
+        return new HttpMessageInvoker(handler);
     }
     
     /// <summary>
@@ -97,76 +154,139 @@ public sealed class WebSocketClient : IAsyncDisposable
     /// </summary>
     public async Task ConnectAsync(CancellationToken cancellationToken = default)
     {
-        State = AppState.Connecting;
         _cts = CancellationTokenSource.CreateLinkedTokenSource(cancellationToken);
+        await ConnectWithRetryAsync(_cts.Token);
+        
+        if (IsConnectionOpen)
+        {
+            _connectionTask = RunConnectionAsync(_cts.Token);
+        }
+    }
+    
+    /// <summary>
+    /// Owns the connection for its lifetime: receives until the socket drops, then reconnects and resumes
+    /// </summary>
+    private async Task RunConnectionAsync(CancellationToken cancellationToken)
+    {
+        while (true)
+        {
+            await ReceiveLoopAsync(cancellationToken);
+            
+            // Stop if not reconnecting: shutdown requested or connection deliberately closed
+            if (cancellationToken.IsCancellationRequested || State == AppState.Disconnected)
+                return;
+            
+            _partnerId = null;
+            
+            try
+            {
+                if (!await WaitBeforeRetryAsync("Connection lost", cancellationToken))
+                    return;
+                
+                await ConnectWithRetryAsync(cancellationToken);
+            }
+            catch (OperationCanceledException)
+            {
+                // Shutdown requested
+                return;
+            }
+            catch (Exception ex) when (IsFatalError(ex))
+            {
+                _fatalError.TrySetException(ex);
+                return;
+            }
+            catch (Exception ex)
+            {
+                _logger.Error("WS", $"Reconnection failed: {ex.Message}");
+                return;
+            }
+            
+            if (!IsConnectionOpen)
+                return;
+        }
+    }
+    
+    /// <summary>
+    /// Connects, retrying with backoff until connected, cancelled, or a fatal error occurs
+    /// </summary>
+    private async Task ConnectWithRetryAsync(CancellationToken cancellationToken)
+    {
+        State = AppState.Connecting;
         
-        while (!_cts.Token.IsCancellationRequested)
+        while (!cancellationToken.IsCancellationRequested)
         {
             try
             {
-                await ConnectInternalAsync(_cts.Token);
+                await ConnectInternalAsync(cancellationToken);
                 _backoff.Reset();
-                
-                // Start receive loop
-                _receiveTask = ReceiveLoopAsync(_cts.Token);
                 return;
             }
             catch (Exception ex) when (ex is not OperationCanceledException)
             {
+                // Not logged here; the caller surfaces it and the application exits
                 if (IsFatalError(ex))
                 {
-                    _logger.Error("WS", $"Fatal error: {ex.Message}");
                     State = AppState.Disconnected;
                     throw;
                 }
                 
-                State = AppState.Reconnecting;
-                var delay = _backoff.NextDelay();
-                _logger.Warn("WS", $"Connection failed. Reconnecting in {delay / 1000}s... (attempt {_backoff.CurrentAttempt})");
-                
-                try
-                {
-                    await Task.Delay(delay, _cts.Token);
-                }
-                catch (OperationCanceledException)
-                {
+                if (!await WaitBeforeRetryAsync("Connection failed", cancellationToken))
                     break;
-                }
                 
                 State = AppState.Connecting;
             }
         }
     }
     
+    /// <summary>
+    /// Waits for the next backoff delay; returns false if cancelled while waiting
+    /// </summary>
+    private async Task<bool> WaitBeforeRetryAsync(string reason, CancellationToken cancellationToken)
+    {
+        State = AppState.Reconnecting;
+        var delay = _backoff.NextDelay();
+        _logger.Warn("WS", $"{reason}. Reconnecting in {delay / 1000.0:0.0}s... (attempt {_backoff.CurrentAttempt})");
+        
+        try
+        {
+            await Task.Delay(delay, cancellationToken);
+            return true;
+        }
+        catch (OperationCanceledException)
+        {
+            return false;
+        }
+    }
+    
     private async Task ConnectInternalAsync(CancellationToken cancellationToken)
     {
         _webSocket?.Dispose();
-        _proxySocket?.Dispose();
         
         _webSocket = new ClientWebSocket();
         
-        // Build WebSocket URL with query params
-        var wsUrl = $"{_config.WebSocketUrl}/ws?sessionId={_config.SessionId}&connectionId={_config.ConnectionId}&secret={_config.Secret}";
-        var uri = new Uri(wsUrl);
-        
-        if (_config.Proxy is { Enabled: true })
+        if (_config.Compression)
         {
-            _logger.Debug("WS", $"Connecting via SOCKS5 proxy {_config.Proxy.Host}:{_config.Proxy.Port}");
-            
-            var connector = new Socks5Connector(_config.Proxy);
-            var targetPort = uri.Port > 0 ? uri.Port : (uri.Scheme == "wss" ? 443 : 80);
-            _proxySocket = await connector.ConnectAsync(uri.Host, targetPort, cancellationToken);
-            
-            var handler = new SocketsHttpHandler
+            // Offer permessage-deflate (RFC 7692); keeping the context lets repeated text share one window.
+            // Servers that do not negotiate it simply get uncompressed frames
+            _webSocket.Options.DangerousDeflateOptions = new WebSocketDeflateOptions
             {
-                ConnectCallback = async (_, _) => new NetworkStream(_proxySocket, ownsSocket: false)
+                ClientMaxWindowBits = 15,
+                ServerMaxWindowBits = 15,
+                ClientContextTakeover = true,
+                ServerContextTakeover = true
             };
+        }
+        
+        if (_proxyInvoker is not null)
+        {
+            if (_logger.IsEnabled(LogLevel.Debug))
+                _logger.Debug("WS", $"Connecting via SOCKS5 proxy {_config.Proxy!.Host}:{_config.Proxy.Port}");
             
-            await _webSocket.ConnectAsync(uri, new HttpMessageInvoker(handler), cancellationToken);
+            await _webSocket.ConnectAsync(_uri, _proxyInvoker, cancellationToken);
         }
         else
         {
-            await _webSocket.ConnectAsync(uri, cancellationToken);
+            await _webSocket.ConnectAsync(_uri, cancellationToken);
         }
         
         _logger.Info("WS", "Connected to server");
@@ -174,8 +294,9 @@ public sealed class WebSocketClient : IAsyncDisposable
     
     private async Task ReceiveLoopAsync(CancellationToken cancellationToken)
     {
-        var buffer = new byte[64 * 1024]; // 64KB buffer
-        var messageBuffer = new MemoryStream();
+        // Pooled so reconnects reuse one receive buffer instead of allocating a new one per connection
+        var buffer = ArrayPool<byte>.Shared.Rent(ReceiveBufferSize);
+        using var messageBuffer = new MemoryStream();
         
         try
         {
@@ -193,10 +314,9 @@ public sealed class WebSocketClient : IAsyncDisposable
                 
                 if (result.EndOfMessage)
                 {
-                    var json = Encoding.UTF8.GetString(messageBuffer.ToArray());
+                    // Parse the accumulated UTF-8 bytes in place; the buffer is only reused once this returns
+                    ProcessMessage(messageBuffer.GetBuffer().AsSpan(0, (int)messageBuffer.Length));
                     messageBuffer.SetLength(0);
-                    
-                    ProcessMessage(json);
                 }
             }
         }
@@ -212,27 +332,25 @@ public sealed class WebSocketClient : IAsyncDisposable
         {
             _logger.Error("WS", $"Receive error: {ex.Message}");
         }
-        
-        // Trigger reconnection if not intentionally closed
-        if (!cancellationToken.IsCancellationRequested && State != AppState.Disconnected)
+        finally
         {
-            _partnerId = null;
-            _ = ReconnectAsync();
+            ArrayPool<byte>.Shared.Return(buffer);
         }
     }
     
-    private void ProcessMessage(string json)
+    private void ProcessMessage(ReadOnlySpan<byte> utf8Json)
     {
         try
         {
-            var message = MessageFactory.Deserialize(json);
+            var message = MessageFactory.Deserialize(utf8Json);
             if (message is null)
             {
                 _logger.Warn("WS", "Received invalid message");
                 return;
             }
             
-            _logger.Debug("WS", $"Received: {message.Header.Type}");
+            if (_logger.IsEnabled(LogLevel.Debug))
+                _logger.Debug("WS", $"Received: {message.Header.Type}");
             
             switch (message)
             {
@@ -303,34 +421,16 @@ public sealed class WebSocketClient : IAsyncDisposable
     
     private void HandleError(ErrorMessage error)
     {
-        _logger.Error("WS", $"{error.Payload.Code}: {error.Payload.Message}");
-        
         // Check for fatal errors
-        if (error.Payload.Code is "INVALID_SECRET" or "SESSION_FULL" or "DUPLICATE_CONNECTION_ID")
+        if (FatalErrorCodes.Contains(error.Payload.Code))
         {
-            throw new WebSocketException($"Fatal error: {error.Payload.Code}");
+            // Disconnected stops the connection task from retrying; the owner logs the error once and exits
+            State = AppState.Disconnected;
+            _fatalError.TrySetException(new WebSocketException($"{error.Payload.Code}: {error.Payload.Message}"));
+            return;
         }
-    }
-    
-    private async Task ReconnectAsync()
-    {
-        State = AppState.Reconnecting;
-        var delay = _backoff.NextDelay();
-        _logger.Warn("WS", $"Connection lost. Reconnecting in {delay / 1000}s... (attempt {_backoff.CurrentAttempt})");
         
-        try
-        {
-            await Task.Delay(delay, _cts?.Token ?? CancellationToken.None);
-            await ConnectAsync(_cts?.Token ?? CancellationToken.None);
-        }
-        catch (OperationCanceledException)
-        {
-            // Shutdown requested
-        }
-        catch (Exception ex)
-        {
-            _logger.Error("WS", $"Reconnection failed: {ex.Message}");
-        }
+        _logger.Error("WS", $"{error.Payload.Code}: {error.Payload.Message}");
     }
     
     /// <summary>
@@ -338,17 +438,41 @@ public sealed class WebSocketClient : IAsyncDisposable
     /// </summary>
     public async Task SendAsync<T>(T message, CancellationToken cancellationToken = default) where T : Message
     {
-        if (_webSocket?.State != WebSocketState.Open)
+        await _sendLock.WaitAsync(cancellationToken);
+        try
         {
-            _logger.Warn("WS", "Cannot send: not connected");
-            return;
+            if (_webSocket?.State != WebSocketState.Open)
+            {
+                _logger.Warn("WS", "Cannot send: not connected");
+                return;
+            }
+            
+            // Serialize straight to UTF-8 in the reused buffer; no intermediate string or byte[] copy
+            _sendBuffer.ResetWrittenCount();
+            _sendWriter.Reset(_sendBuffer);
+            MessageFactory.Serialize(_sendWriter, message);
+            
+            var flags = _sendBuffer.WrittenCount < MinCompressedMessageSize
+                ? WebSocketMessageFlags.EndOfMessage | WebSocketMessageFlags.DisableCompression
+                : WebSocketMessageFlags.EndOfMessage;
+            
+            await _webSocket.SendAsync(_sendBuffer.WrittenMemory, WebSocketMessageType.Text, flags, cancellationToken);
+        }
+        finally
+        {
+            // Drop a buffer grown by an image or file send; the writer holds a reference too,
+            // so point it at the new buffer or the old one stays alive until the next send
+            if (_sendBuffer.Capacity > MaxRetainedSendBufferSize)
+            {
+                _sendBuffer = new ArrayBufferWriter<byte>(SendBufferSize);
+                _sendWriter.Reset(_sendBuffer);
+            }
+            
+            _sendLock.Release();
         }
         
-        var json = MessageFactory.Serialize(message);
-        var bytes = Encoding.UTF8.GetBytes(json);
-        
-        await _webSocket.SendAsync(bytes, WebSocketMessageType.Text, true, cancellationToken);
-        _logger.Debug("WS", $"Sent: {message.Header.Type}");
+        if (_logger.IsEnabled(LogLevel.Debug))
+            _logger.Debug("WS", $"Sent: {message.Header.Type}");
     }
     
     /// <summary>
@@ -370,11 +494,11 @@ public sealed class WebSocketClient : IAsyncDisposable
             }
         }
         
-        if (_receiveTask is not null)
+        if (_connectionTask is not null)
         {
             try
             {
-                await _receiveTask;
+                await _connectionTask;
             }
             catch
             {
@@ -388,18 +512,25 @@ public sealed class WebSocketClient : IAsyncDisposable
     private static bool IsFatalError(Exception ex)
     {
         // Check for authentication or session errors
-        return ex.Message.Contains("401") || 
-               ex.Message.Contains("403") ||
-               ex.Message.Contains("INVALID_SECRET") ||
-               ex.Message.Contains("SESSION_FULL") ||
-               ex.Message.Contains("DUPLICATE_CONNECTION_ID");
+        if (ex.Message.Contains("401") || ex.Message.Contains("403"))
+            return true;
+        
+        foreach (var code in FatalErrorCodes)
+        {
+            if (ex.Message.Contains(code))
+                return true;
+        }
+        
+        return false;
     }
     
     public async ValueTask DisposeAsync()
     {
         await CloseAsync();
         _webSocket?.Dispose();
-        _proxySocket?.Dispose();
+        _proxyInvoker?.Dispose();
+        _sendWriter.Dispose();
+        _sendLock.Dispose();
         _cts?.Dispose();
     }
 }
@@ -1,4 +1,5 @@
-﻿using WSClip.Config;
+﻿using System.Runtime.InteropServices;
+using WSClip.Config;
 using WSClip.Sync;
 using WSClip.Utils;
 
@@ -11,6 +12,17 @@ public static class Program
 {
     private static readonly Logger _logger = Logger.Instance;
     
+    // Windows ends the process a few seconds after a console close or shutdown, or once the handler returns
+    private static readonly TimeSpan ConsoleCloseTimeout = TimeSpan.FromSeconds(4);
+    
+    private static readonly string Banner = """
+
+        WSClip - Clipboard Synchronization Client
+        ==========================================
+
+
+        """.ReplaceLineEndings();
+    
     public static async Task<int> Main(string[] args)
     {
         // Parse arguments
@@ -31,7 +43,11 @@ public static class Program
         // Configure logging
         _logger.MinLevel = options.Verbose ? LogLevel.Debug : LogLevel.Info;
         
-        PrintBanner();
+        // The banner is decoration for interactive use; skip it when output is piped or logged to a file
+        if (!Console.IsOutputRedirected)
+        {
+            PrintBanner();
+        }
         
         try
         {
@@ -76,13 +92,8 @@ public static class Program
         }
         else
         {
-            // Try default path
-            var defaultPath = ConfigLoader.GetDefaultConfigPath();
-            
-            if (File.Exists(defaultPath))
-            {
-                config = await ConfigLoader.LoadAsync(defaultPath);
-            }
+            // Try default path (LoadAsync returns null when the file does not exist)
+            config = await ConfigLoader.LoadAsync(ConfigLoader.GetDefaultConfigPath());
         }
         
         // Validate existing config
@@ -113,39 +124,46 @@ public static class Program
     private static async Task<int> RunSyncService(AppConfig config)
     {
         using var cts = new CancellationTokenSource();
+        using var stopped = new ManualResetEventSlim();
         
-        // Setup Ctrl+C handler
-        Console.CancelKeyPress += (_, e) =>
+        // Ctrl+C, console close and termination requests all cancel the token, so shutdown always
+        // runs through StopAsync. Disposing a registration does not wait for a handler that is already
+        // running, so a signal arriving during teardown can find cts or stopped disposed
+        void OnShutdownSignal(PosixSignalContext context)
         {
-            e.Cancel = true;
-            _logger.Info("APP", "Shutdown requested (Ctrl+C)");
-            try
-            {
-                if (!cts.IsCancellationRequested)
-                    cts.Cancel();
-            }
-            catch (ObjectDisposedException)
+            context.Cancel = true;
+            _logger.Info("APP", context.Signal switch
             {
-                // Already disposed, ignore
-            }
-        };
-        
-        // Setup SIGTERM handler
-        AppDomain.CurrentDomain.ProcessExit += (_, _) =>
-        {
+                PosixSignal.SIGINT => "Shutdown requested (Ctrl+C)",
+                PosixSignal.SIGHUP => "Shutdown requested (console closed)",
+                _ => "Shutdown requested (SIGTERM)"
+            });
             try
             {
                 if (!cts.IsCancellationRequested)
                     cts.Cancel();
+                
+                // Console close and system shutdown cannot be cancelled on Windows; hold the handler
+                // until cleanup has run
+                if (context.Signal != PosixSignal.SIGINT)
+                    stopped.Wait(ConsoleCloseTimeout);
             }
             catch (ObjectDisposedException)
             {
-                // Already disposed, ignore
+                // Teardown already finished
             }
-        };
+        }
+        
+        // On Windows, SIGHUP is raised for console close and SIGTERM for system shutdown
+        using var sigInt = PosixSignalRegistration.Create(PosixSignal.SIGINT, OnShutdownSignal);
+        using var sigTerm = PosixSignalRegistration.Create(PosixSignal.SIGTERM, OnShutdownSignal);
+        using var sigHup = PosixSignalRegistration.Create(PosixSignal.SIGHUP, OnShutdownSignal);
         
         await using var syncService = new SyncService(config);
         
+        // Interactive prompts are done; from here on only log lines reach the console
+        _logger.StartBackgroundWriter();
+        
         try
         {
             await syncService.StartAsync(cts.Token);
@@ -157,7 +175,17 @@ public static class Program
         }
         finally
         {
-            await syncService.StopAsync();
+            try
+            {
+                await syncService.StopAsync();
+            }
+            finally
+            {
+                // Runs even if shutdown failed: drain the log queue, so later lines such as Main's
+                // fatal error are written inline, and release a signal handler waiting on cleanup
+                await _logger.FlushAsync();
+                stopped.Set();
+            }
         }
         
         _logger.Info("APP", "Goodbye!");
@@ -201,13 +229,7 @@ public static class Program
         return options;
     }
     
-    private static void PrintBanner()
-    {
-        Console.WriteLine();
-        Console.WriteLine("WSClip - Clipboard Synchronization Client");
-        Console.WriteLine("==========================================");
-        Console.WriteLine();
-    }
+    private static void PrintBanner() => Console.Write(Banner);
     
     private static void PrintVersion()
     {
@@ -217,26 +239,30 @@ public static class Program
     
     private static void PrintHelp()
     {
-        Console.WriteLine("WSClip - Clipboard Synchronization Client");
-        Console.WriteLine();
-        Console.WriteLine("USAGE:");
-        Console.WriteLine("  wsclip [OPTIONS]");
-        Console.WriteLine();
-        Console.WriteLine("OPTIONS:");
-        Console.WriteLine("  -c, --config <PATH>  Path to configuration file");
-        Console.WriteLine("  -v, --verbose        Enable verbose (debug) logging");
-        Console.WriteLine("  -h, --help           Show this help message");
-        Console.WriteLine("      --version        Show version information");
-        Console.WriteLine();
-        Console.WriteLine("CONFIGURATION:");
-        Console.WriteLine("  On first run, a configuration wizard will guide you through setup.");
-        Console.WriteLine("  Configuration is stored in:");
-        Console.WriteLine($"    {ConfigLoader.GetDefaultConfigPath()}");
-        Console.WriteLine();
-        Console.WriteLine("EXAMPLES:");
-        Console.WriteLine("  wsclip                      Run with default configuration");
-        Console.WriteLine("  wsclip -v                   Run with verbose logging");
-        Console.WriteLine("  wsclip -c ./myconfig.json   Run with custom config file");
+        // Rendered as one block so help costs a single console write
+        Console.Write($"""
+            WSClip - Clipboard Synchronization Client
+
+            USAGE:
+              wsclip [OPTIONS]
+
+            OPTIONS:
+              -c, --config <PATH>  Path to configuration file
+              -v, --verbose        Enable verbose (debug) logging
+              -h, --help           Show this help message
+                  --version        Show version information
+
+            CONFIGURATION:
+              On first run, a configuration wizard will guide you through setup.
+              Configuration is stored in:
+                {ConfigLoader.GetDefaultConfigPath()}
+
+            EXAMPLES:
+              wsclip                      Run with default configuration
+              wsclip -v                   Run with verbose logging
+              wsclip -c ./myconfig.json   Run with custom config file
+
+            """.ReplaceLineEndings());
     }
 }
 
@@ -7,11 +7,8 @@ namespace WSClip.Protocol;
 /// </summary>
 public static class MessageFactory
 {
-    private static readonly JsonSerializerOptions JsonOptions = new()
-    {
-        PropertyNamingPolicy = JsonNamingPolicy.CamelCase,
-        DefaultIgnoreCondition = System.Text.Json.Serialization.JsonIgnoreCondition.WhenWritingNull
-    };
+    // Backed by the source-generated context, so no reflection-based serialization at runtime
+    private static readonly JsonSerializerOptions JsonOptions = ProtocolJsonContext.Default.Options;
     
     /// <summary>
     /// Creates a new message header with UUID and timestamp
@@ -26,7 +23,13 @@ public static class MessageFactory
     /// <summary>
     /// Creates a DATA message for text content
     /// </summary>
-    public static DataMessage CreateTextData(string text) => new()
+    public static DataMessage CreateTextData(string text) =>
+        CreateTextData(text, System.Text.Encoding.UTF8.GetByteCount(text));
+    
+    /// <summary>
+    /// Creates a DATA message for text content whose UTF-8 byte count is already known
+    /// </summary>
+    public static DataMessage CreateTextData(string text, long size) => new()
     {
         Header = CreateHeader(MessageType.Data),
         Payload = new DataPayload
@@ -36,7 +39,7 @@ public static class MessageFactory
             Metadata = new DataMetadata
             {
                 MimeType = "text/plain",
-                Size = System.Text.Encoding.UTF8.GetByteCount(text)
+                Size = size
             }
         }
     };
@@ -44,36 +47,27 @@ public static class MessageFactory
     /// <summary>
     /// Creates a DATA message for binary content (image)
     /// </summary>
-    public static DataMessage CreateImageData(byte[] imageBytes) => new()
-    {
-        Header = CreateHeader(MessageType.Data),
-        Payload = new DataPayload
-        {
-            ContentType = ContentType.Binary,
-            Data = Convert.ToBase64String(imageBytes),
-            Metadata = new DataMetadata
-            {
-                MimeType = "image/png",
-                Size = imageBytes.Length
-            }
-        }
-    };
+    public static DataMessage CreateImageData(byte[] imageBytes) =>
+        CreateBinaryData(imageBytes, "image/png", filename: null);
     
     /// <summary>
     /// Creates a DATA message for file content
     /// </summary>
-    public static DataMessage CreateFileData(byte[] fileBytes, string filename, string mimeType) => new()
+    public static DataMessage CreateFileData(byte[] fileBytes, string filename, string mimeType) =>
+        CreateBinaryData(fileBytes, mimeType, filename);
+    
+    private static DataMessage CreateBinaryData(byte[] bytes, string mimeType, string? filename) => new()
     {
         Header = CreateHeader(MessageType.Data),
         Payload = new DataPayload
         {
             ContentType = ContentType.Binary,
-            Data = Convert.ToBase64String(fileBytes),
+            Data = Convert.ToBase64String(bytes),
             Metadata = new DataMetadata
             {
                 MimeType = mimeType,
                 Filename = filename,
-                Size = fileBytes.Length
+                Size = bytes.Length
             }
         }
     };
@@ -105,45 +99,76 @@ public static class MessageFactory
     };
     
     /// <summary>
-    /// Serializes a message to JSON
+    /// Serializes a message as UTF-8 JSON into the given writer
     /// </summary>
-    public static string Serialize<T>(T message) where T : Message => 
-        JsonSerializer.Serialize(message, JsonOptions);
+    public static void Serialize<T>(Utf8JsonWriter writer, T message) where T : Message =>
+        JsonSerializer.Serialize(writer, message, JsonOptions);
     
     /// <summary>
     /// Extracts the short ID (last segment) from a UUID
     /// </summary>
     public static string GetShortId(string messageId)
     {
-        var segments = messageId.Split('-');
-        return segments.Length > 0 ? segments[^1] : messageId;
+        // Only the last segment is needed, so slice it off instead of splitting the whole ID
+        var lastDash = messageId.LastIndexOf('-');
+        return lastDash >= 0 ? messageId[(lastDash + 1)..] : messageId;
     }
     
     /// <summary>
-    /// Deserializes a message from JSON, determining type from header
+    /// Deserializes a message from UTF-8 JSON, determining type from header
     /// </summary>
-    public static Message? Deserialize(string json)
+    public static Message? Deserialize(ReadOnlySpan<byte> utf8Json)
     {
-        using var doc = JsonDocument.Parse(json);
-        var root = doc.RootElement;
+        // Peek at header.type with a forward-only reader, then bind the frame once into the
+        // matching type; no DOM is built and the bytes are never transcoded to a string
+        return ReadMessageType(utf8Json) switch
+        {
+            "ready" => JsonSerializer.Deserialize(utf8Json, ProtocolJsonContext.Default.ReadyMessage),
+            "connection" => JsonSerializer.Deserialize(utf8Json, ProtocolJsonContext.Default.ConnectionMessage),
+            "error" => JsonSerializer.Deserialize(utf8Json, ProtocolJsonContext.Default.ErrorMessage),
+            "data" => JsonSerializer.Deserialize(utf8Json, ProtocolJsonContext.Default.DataMessage),
+            "ack" => JsonSerializer.Deserialize(utf8Json, ProtocolJsonContext.Default.AckMessage),
+            "control" => JsonSerializer.Deserialize(utf8Json, ProtocolJsonContext.Default.ControlMessage),
+            _ => null
+        };
+    }
+    
+    private static string? ReadMessageType(ReadOnlySpan<byte> utf8Json)
+    {
+        var reader = new Utf8JsonReader(utf8Json);
         
-        if (!root.TryGetProperty("header", out var header))
+        if (!reader.Read() || reader.TokenType != JsonTokenType.StartObject)
             return null;
         
-        if (!header.TryGetProperty("type", out var typeElement))
+        // Walk the top-level properties until "header", skipping any other values
+        while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
+        {
+            var isHeader = reader.ValueTextEquals("header"u8);
+            reader.Read();
+            
+            if (!isHeader)
+            {
+                reader.Skip();
+                continue;
+            }
+            
+            if (reader.TokenType != JsonTokenType.StartObject)
+                return null;
+            
+            while (reader.Read() && reader.TokenType == JsonTokenType.PropertyName)
+            {
+                var isType = reader.ValueTextEquals("type"u8);
+                reader.Read();
+                
+                if (isType)
+                    return reader.TokenType == JsonTokenType.String ? reader.GetString() : null;
+                
+                reader.Skip();
+            }
+            
             return null;
+        }
         
-        var typeStr = typeElement.GetString();
-        
-        return typeStr switch
-        {
-            "ready" => JsonSerializer.Deserialize<ReadyMessage>(json, JsonOptions),
-            "connection" => JsonSerializer.Deserialize<ConnectionMessage>(json, JsonOptions),
-            "error" => JsonSerializer.Deserialize<ErrorMessage>(json, JsonOptions),
-            "data" => JsonSerializer.Deserialize<DataMessage>(json, JsonOptions),
-            "ack" => JsonSerializer.Deserialize<AckMessage>(json, JsonOptions),
-            "control" => JsonSerializer.Deserialize<ControlMessage>(json, JsonOptions),
-            _ => null
-        };
+        return null;
     }
 }
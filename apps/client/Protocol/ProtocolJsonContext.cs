@@ -0,0 +1,25 @@
+using System.Text.Json;
+using System.Text.Json.Serialization;
+
+namespace WSClip.Protocol;
+
+/// <summary>
+/// Compile-time generated JSON metadata for protocol messages
+/// </summary>
+[JsonSourceGenerationOptions(DefaultIgnoreCondition = JsonIgnoreCondition.WhenWritingNull)]
+[JsonSerializable(typeof(ReadyMessage))]
+[JsonSerializable(typeof(ConnectionMessage))]
+[JsonSerializable(typeof(ErrorMessage))]
+[JsonSerializable(typeof(DataMessage))]
+[JsonSerializable(typeof(AckMessage))]
+[JsonSerializable(typeof(ControlMessage))]
+// Value types that may appear in the free-form metadata dictionaries
+[JsonSerializable(typeof(string))]
+[JsonSerializable(typeof(bool))]
+[JsonSerializable(typeof(int))]
+[JsonSerializable(typeof(long))]
+[JsonSerializable(typeof(double))]
+[JsonSerializable(typeof(JsonElement))]
+internal sealed partial class ProtocolJsonContext : JsonSerializerContext
+{
+}
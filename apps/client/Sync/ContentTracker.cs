@@ -1,5 +1,6 @@
+using System.Buffers.Binary;
+using System.Runtime.InteropServices;
 using System.Security.Cryptography;
-using System.Text;
 using WSClip.Utils;
 
 namespace WSClip.Sync;
@@ -12,13 +13,16 @@ public sealed class ContentTracker
     private readonly Logger _logger = Logger.Instance;
     private readonly object _lock = new();
     
-    // For preventing echo loops (content received from partner)
-    private string? _lastAppliedHash;
+    // For preventing echo loops (content received from partner); a few recent items are kept so
+    // quickly alternating content is still recognized, not just the very last one
+    private const int RecentAppliedCapacity = 8;
+    private readonly (UInt128 Hash, DateTime Time)[] _recentApplied = new (UInt128, DateTime)[RecentAppliedCapacity];
+    private int _recentAppliedNext;
     private DateTime _lastAppliedTime = DateTime.MinValue;
     private static readonly TimeSpan SuppressWindow = TimeSpan.FromMilliseconds(500);
     
     // For preventing duplicate sends (same content sent twice)
-    private string? _lastSentHash;
+    private UInt128? _lastSentHash;
     private DateTime _lastSentTime = DateTime.MinValue;
     private static readonly TimeSpan DuplicateSendWindow = TimeSpan.FromMilliseconds(1000);
     
@@ -29,9 +33,15 @@ public sealed class ContentTracker
     {
         lock (_lock)
         {
-            _lastAppliedHash = ComputeHash(data, text);
+            if (ComputeHash(data, text) is not { } hash)
+                return;
+            
             _lastAppliedTime = DateTime.UtcNow;
-            _logger.Debug("SYNC", $"Marked content as applied: {_lastAppliedHash?[..16]}...");
+            _recentApplied[_recentAppliedNext] = (hash, _lastAppliedTime);
+            _recentAppliedNext = (_recentAppliedNext + 1) % RecentAppliedCapacity;
+            
+            if (_logger.IsEnabled(LogLevel.Debug))
+                _logger.Debug("SYNC", $"Marked content as applied: {hash:x32}");
         }
     }
     
@@ -54,20 +64,31 @@ public sealed class ContentTracker
     {
         lock (_lock)
         {
+            var now = DateTime.UtcNow;
+            var inSuppressWindow = now - _lastAppliedTime < SuppressWindow;
+            var inDuplicateWindow = now - _lastSentTime < DuplicateSendWindow;
+            
+            // Outside both windows nothing can match; skip hashing the content entirely
+            if (!inSuppressWindow && !inDuplicateWindow)
+                return true;
+            
             var currentHash = ComputeHash(data, text);
             
             // Check if this is content we just received from partner (echo prevention)
-            if (DateTime.UtcNow - _lastAppliedTime < SuppressWindow)
+            if (inSuppressWindow && currentHash is { } hash)
             {
-                if (currentHash == _lastAppliedHash)
+                foreach (var (appliedHash, appliedTime) in _recentApplied)
                 {
-                    _logger.Debug("SYNC", "Content matches last applied, suppressing send");
-                    return false;
+                    if (appliedHash == hash && now - appliedTime < SuppressWindow)
+                    {
+                        _logger.Debug("SYNC", "Content matches recently applied, suppressing send");
+                        return false;
+                    }
                 }
             }
             
             // Check if we just sent this exact content (duplicate prevention)
-            if (DateTime.UtcNow - _lastSentTime < DuplicateSendWindow)
+            if (inDuplicateWindow)
             {
                 if (currentHash == _lastSentHash)
                 {
@@ -87,16 +108,20 @@ public sealed class ContentTracker
     {
         lock (_lock)
         {
-            _lastAppliedHash = null;
+            Array.Clear(_recentApplied);
+            _recentAppliedNext = 0;
             _lastAppliedTime = DateTime.MinValue;
             _lastSentHash = null;
             _lastSentTime = DateTime.MinValue;
         }
     }
     
-    private static string? ComputeHash(byte[]? data, string? text)
+    /// <summary>
+    /// Hashes content to a fixed-size value (first 128 bits of SHA-256) that compares without allocating
+    /// </summary>
+    private static UInt128? ComputeHash(byte[]? data, string? text)
     {
-        byte[] bytes;
+        ReadOnlySpan<byte> bytes;
         
         if (data is { Length: > 0 })
         {
@@ -104,14 +129,17 @@ public sealed class ContentTracker
         }
         else if (!string.IsNullOrEmpty(text))
         {
-            bytes = Encoding.UTF8.GetBytes(text);
+            // Hash the string's UTF-16 code units in place; text is only ever compared with text,
+            // so the encoding just has to be consistent, and no UTF-8 copy is needed
+            bytes = MemoryMarshal.AsBytes(text.AsSpan());
         }
         else
         {
             return null;
         }
         
-        var hash = SHA256.HashData(bytes);
-        return Convert.ToHexString(hash);
+        Span<byte> hash = stackalloc byte[SHA256.HashSizeInBytes];
+        SHA256.HashData(bytes, hash);
+        return BinaryPrimitives.ReadUInt128LittleEndian(hash);
     }
 }
@@ -17,14 +17,21 @@ public sealed class SyncService : IAsyncDisposable
     private readonly ClipboardMonitor _clipboardMonitor;
     private readonly ContentTracker _contentTracker = new();
     private readonly TempFileManager _tempFileManager = new();
+    private readonly string _maxContentSizeLabel;
     
     private bool _disposed;
+    private bool _stopped;
     private bool _syncActive;
     private CancellationTokenSource? _cts;
     
+    // Latest-wins hand-off between clipboard events and the single in-flight send
+    private ClipboardContent? _pendingContent;
+    private int _sendLoopActive;
+    
     public SyncService(AppConfig config)
     {
         _config = config;
+        _maxContentSizeLabel = SizeFormatter.Format(config.MaxContentSize);
         _wsClient = new WebSocketClient(config);
         _clipboardMonitor = new ClipboardMonitor();
         
@@ -59,31 +66,35 @@ public sealed class SyncService : IAsyncDisposable
     }
     
     /// <summary>
-    /// Runs the service until cancellation (keeps alive)
+    /// Runs the service until cancellation (keeps alive); throws if a fatal server error ends the connection
     /// </summary>
     public async Task RunAsync(CancellationToken cancellationToken)
     {
-        // Just wait for cancellation - the WebSocket handles its own receive loop
-        try
-        {
-            await Task.Delay(Timeout.Infinite, cancellationToken);
-        }
-        catch (OperationCanceledException)
-        {
-            // Expected on shutdown
-        }
+        // The WebSocket handles its own receive loop; just wait for cancellation or a fatal error.
+        // Cancellation is the normal shutdown path, so it completes without throwing.
+        var cancelled = Task.Delay(Timeout.Infinite, cancellationToken);
+        var finished = await Task.WhenAny(cancelled, _wsClient.FatalError);
+        
+        if (finished == _wsClient.FatalError)
+            await finished;
     }
     
     /// <summary>
-    /// Stops the sync service
+    /// Stops the sync service; subsequent calls are no-ops
     /// </summary>
     public async Task StopAsync()
     {
+        if (_stopped) return;
+        _stopped = true;
+        
         _logger.Info("SYNC", "Stopping synchronization service");
         
         _clipboardMonitor.Stop();
-        await _wsClient.CloseAsync();
-        _tempFileManager.Cleanup();
+        
+        // Close handshake and temp file removal are independent; await them together
+        await Task.WhenAll(
+            _wsClient.CloseAsync(),
+            Task.Run(_tempFileManager.Cleanup));
     }
     
     private void OnWebSocketStateChanged(object? sender, StateChangedEventArgs e)
@@ -104,8 +115,8 @@ public sealed class SyncService : IAsyncDisposable
         }
         else
         {
+            // Tracking state was already cleared by the preceding state change to WaitingForPartner
             _logger.Info("SYNC", "Partner disconnected");
-            _contentTracker.Clear();
         }
     }
     
@@ -117,14 +128,31 @@ public sealed class SyncService : IAsyncDisposable
             return;
         }
         
-        try
-        {
-            await SendClipboardContent(e.Content);
-        }
-        catch (Exception ex)
+        // A change that arrives while a send is in flight replaces any change still waiting,
+        // so a burst of copies sends only the newest content once the current send finishes
+        Interlocked.Exchange(ref _pendingContent, e.Content);
+        
+        if (Interlocked.CompareExchange(ref _sendLoopActive, 1, 0) != 0)
+            return;
+        
+        do
         {
-            _logger.Warn("SYNC", $"Error sending clipboard: {ex.Message}");
-        }
+            while (Interlocked.Exchange(ref _pendingContent, null) is { } content)
+            {
+                try
+                {
+                    await SendClipboardContent(content);
+                }
+                catch (Exception ex)
+                {
+                    _logger.Warn("SYNC", $"Error sending clipboard: {ex.Message}");
+                }
+            }
+            
+            // Release the flag, then re-check for content queued just before the release
+            Volatile.Write(ref _sendLoopActive, 0);
+        } while (Volatile.Read(ref _pendingContent) is not null &&
+                 Interlocked.CompareExchange(ref _sendLoopActive, 1, 0) == 0);
     }
     
     private async Task SendClipboardContent(ClipboardContent content)
@@ -135,21 +163,25 @@ public sealed class SyncService : IAsyncDisposable
             return;
         }
         
+        // Size is computed, a full UTF-8 scan for text; take it once for the whole send
+        var size = content.Size;
+        
         // Validate content size against maxContentSize
-        if (content.Size > _config.MaxContentSize)
+        if (size > _config.MaxContentSize)
         {
-            _logger.Warn("SYNC", $"Content too large: {SizeFormatter.Format(content.Size)} > {SizeFormatter.Format(_config.MaxContentSize)} (max)");
+            _logger.Warn("SYNC", $"Content too large: {SizeFormatter.Format(size)} > {_maxContentSizeLabel} (max)");
             return;
         }
         
-        _logger.Debug("SYNC", $"Sending {content.Type} content");
+        if (_logger.IsEnabled(LogLevel.Debug))
+            _logger.Debug("SYNC", $"Sending {GetTypeLabel(content.Type)} content");
         
         DataMessage message;
         
         switch (content.Type)
         {
             case ClipboardContentType.Text:
-                message = MessageFactory.CreateTextData(content.Text!);
+                message = MessageFactory.CreateTextData(content.Text!, size);
                 break;
                 
             case ClipboardContentType.Image:
@@ -174,12 +206,20 @@ public sealed class SyncService : IAsyncDisposable
         var shortId = MessageFactory.GetShortId(message.Header.Id);
         var logMessage = content.Type switch
         {
-            ClipboardContentType.File => $"Sent: file \"{content.FileName}\" ({SizeFormatter.Format(content.Size)}) [{shortId}]",
-            _ => $"Sent: {content.Type.ToString().ToLower()} ({SizeFormatter.Format(content.Size)}) [{shortId}]"
+            ClipboardContentType.File => $"Sent: file \"{content.FileName}\" ({SizeFormatter.Format(size)}) [{shortId}]",
+            _ => $"Sent: {GetTypeLabel(content.Type)} ({SizeFormatter.Format(size)}) [{shortId}]"
         };
         _logger.Info("SYNC", logMessage);
     }
     
+    private static string GetTypeLabel(ClipboardContentType type) => type switch
+    {
+        ClipboardContentType.Text => "text",
+        ClipboardContentType.Image => "image",
+        ClipboardContentType.File => "file",
+        _ => type.ToString().ToLowerInvariant()
+    };
+    
     private async void OnMessageReceived(object? sender, MessageReceivedEventArgs e)
     {
         try
@@ -211,16 +251,18 @@ public sealed class SyncService : IAsyncDisposable
         if (payload.ContentType == ContentType.Text)
         {
             var text = payload.Data; // TEXT is raw UTF-8, not base64
-            var textBytes = System.Text.Encoding.UTF8.GetBytes(text);
+            
+            // Count the UTF-8 size without materializing the encoded bytes
+            var textSize = System.Text.Encoding.UTF8.GetByteCount(text);
             
             // Validate size
-            if (textBytes.Length > _config.MaxContentSize)
+            if (textSize > _config.MaxContentSize)
             {
-                _logger.Warn("SYNC", $"Received content too large: {SizeFormatter.Format(textBytes.Length)} > {SizeFormatter.Format(_config.MaxContentSize)} (max), ignoring");
+                _logger.Warn("SYNC", $"Received content too large: {SizeFormatter.Format(textSize)} > {_maxContentSizeLabel} (max), ignoring");
                 return;
             }
             
-            _logger.Info("SYNC", $"Received: text ({SizeFormatter.Format(textBytes.Length)}) [{shortId}]");
+            _logger.Info("SYNC", $"Received: text ({SizeFormatter.Format(textSize)}) [{shortId}]");
             
             // Mark as applied before writing to clipboard
             _contentTracker.MarkAsApplied(null, text);
@@ -234,7 +276,7 @@ public sealed class SyncService : IAsyncDisposable
             // Validate size
             if (decodedData.Length > _config.MaxContentSize)
             {
-                _logger.Warn("SYNC", $"Received content too large: {SizeFormatter.Format(decodedData.Length)} > {SizeFormatter.Format(_config.MaxContentSize)} (max), ignoring");
+                _logger.Warn("SYNC", $"Received content too large: {SizeFormatter.Format(decodedData.Length)} > {_maxContentSizeLabel} (max), ignoring");
                 return;
             }
             
@@ -272,6 +314,9 @@ public sealed class SyncService : IAsyncDisposable
         if (_disposed) return;
         _disposed = true;
         
+        // Shutdown runs once whether or not the owner already called StopAsync
+        await StopAsync();
+        
         _clipboardMonitor.Dispose();
         await _wsClient.DisposeAsync();
         _tempFileManager.Dispose();
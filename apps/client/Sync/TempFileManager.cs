@@ -1,3 +1,4 @@
+using System.Buffers;
 using WSClip.Utils;
 
 namespace WSClip.Sync;
@@ -7,17 +8,19 @@ namespace WSClip.Sync;
 /// </summary>
 public sealed class TempFileManager : IDisposable
 {
+    private static readonly SearchValues<char> InvalidFileNameChars = SearchValues.Create(Path.GetInvalidFileNameChars());
+    
     private readonly Logger _logger = Logger.Instance;
     private readonly string _basePath;
     private readonly List<string> _currentFiles = [];
     private readonly object _lock = new();
     private bool _disposed;
+    private bool _directoryCreated;
     
     public TempFileManager()
     {
+        // The directory itself is created on first save; most sessions never receive a file
         _basePath = Path.Combine(Path.GetTempPath(), "wsclip");
-        Directory.CreateDirectory(_basePath);
-        _logger.Debug("FILES", $"Temp directory: {_basePath}");
     }
     
     /// <summary>
@@ -43,6 +46,7 @@ public sealed class TempFileManager : IDisposable
         {
             // Clean previous files
             CleanupCurrent();
+            EnsureDirectory();
             
             var paths = new List<string>();
             
@@ -57,7 +61,8 @@ public sealed class TempFileManager : IDisposable
                     paths.Add(path);
                     _currentFiles.Add(path);
                     
-                    _logger.Debug("FILES", $"Saved: {safeName} ({SizeFormatter.Format(data.Length)})");
+                    if (_logger.IsEnabled(LogLevel.Debug))
+                        _logger.Debug("FILES", $"Saved: {safeName} ({SizeFormatter.Format(data.Length)})");
                 }
                 catch (Exception ex)
                 {
@@ -86,6 +91,7 @@ public sealed class TempFileManager : IDisposable
                     Directory.Delete(_basePath, recursive: true);
                     _logger.Debug("FILES", "Cleaned up temp directory");
                 }
+                _directoryCreated = false;
             }
             catch (Exception ex)
             {
@@ -94,6 +100,15 @@ public sealed class TempFileManager : IDisposable
         }
     }
     
+    private void EnsureDirectory()
+    {
+        if (_directoryCreated) return;
+        
+        Directory.CreateDirectory(_basePath);
+        _directoryCreated = true;
+        _logger.Debug("FILES", $"Temp directory: {_basePath}");
+    }
+    
     private void CleanupCurrent()
     {
         foreach (var file in _currentFiles)
@@ -131,10 +146,13 @@ public sealed class TempFileManager : IDisposable
     
     private static string SanitizeFileName(string fileName)
     {
-        var invalidChars = Path.GetInvalidFileNameChars();
-        var sanitized = new string(fileName
-            .Select(c => invalidChars.Contains(c) ? '_' : c)
-            .ToArray());
+        var sanitized = fileName.AsSpan().ContainsAny(InvalidFileNameChars)
+            ? string.Create(fileName.Length, fileName, (span, name) =>
+            {
+                for (int i = 0; i < span.Length; i++)
+                    span[i] = InvalidFileNameChars.Contains(name[i]) ? '_' : name[i];
+            })
+            : fileName;
         
         // Ensure not empty
         if (string.IsNullOrWhiteSpace(sanitized))
@@ -1,7 +1,7 @@
 namespace WSClip.Utils;
 
 /// <summary>
-/// Calculates exponential backoff delays for reconnection attempts
+/// Calculates reconnection delays using exponential backoff with decorrelated jitter
 /// </summary>
 public sealed class BackoffCalculator
 {
@@ -9,13 +9,22 @@ public sealed class BackoffCalculator
     private readonly int _maxDelayMs;
     private readonly double _multiplier;
     private int _attempt;
+    private int _previousDelayMs;
     
-    public BackoffCalculator(int initialDelayMs = 1000, int maxDelayMs = 30000, double multiplier = 2.0)
+    /// <summary>
+    /// Creates a calculator whose delays grow up to <paramref name="multiplier"/> times the previous delay
+    /// </summary>
+    /// <param name="multiplier">
+    /// Upper bound of the random range for the next delay, as a multiple of the previous delay. It is not a
+    /// fixed growth factor: with the default of 3, each delay averages about 1.5 times the previous one.
+    /// </param>
+    public BackoffCalculator(int initialDelayMs = 1000, int maxDelayMs = 30000, double multiplier = 3.0)
     {
         _initialDelayMs = initialDelayMs;
         _maxDelayMs = maxDelayMs;
         _multiplier = multiplier;
         _attempt = 0;
+        _previousDelayMs = initialDelayMs;
     }
     
     /// <summary>
@@ -23,8 +32,11 @@ public sealed class BackoffCalculator
     /// </summary>
     public int NextDelay()
     {
-        var delay = (int)(_initialDelayMs * Math.Pow(_multiplier, _attempt));
-        delay = Math.Min(delay, _maxDelayMs);
+        // Pick uniformly between the initial delay and a multiple of the previous one,
+        // so clients dropped together by a relay restart do not retry in lockstep
+        var upperMs = (int)Math.Min(_maxDelayMs, _previousDelayMs * _multiplier);
+        var delay = Random.Shared.Next(_initialDelayMs, Math.Max(_initialDelayMs, upperMs) + 1);
+        _previousDelayMs = delay;
         _attempt++;
         return delay;
     }
@@ -37,5 +49,9 @@ public sealed class BackoffCalculator
     /// <summary>
     /// Resets the backoff calculator to initial state
     /// </summary>
-    public void Reset() => _attempt = 0;
+    public void Reset()
+    {
+        _attempt = 0;
+        _previousDelayMs = _initialDelayMs;
+    }
 }
@@ -1,3 +1,5 @@
+using System.Threading.Channels;
+
 namespace WSClip.Utils;
 
 /// <summary>
@@ -16,53 +18,108 @@ public enum LogLevel
 /// </summary>
 public sealed class Logger
 {
-    private static Logger? _instance;
-    private static readonly Lock _lock = new();
-    
     public LogLevel MinLevel { get; set; } = LogLevel.Info;
     
-    public static Logger Instance
-    {
-        get
-        {
-            if (_instance is null)
-            {
-                lock (_lock)
-                {
-                    _instance ??= new Logger();
-                }
-            }
-            return _instance;
-        }
-    }
+    /// <summary>
+    /// Shared logger instance; the runtime guarantees thread-safe one-time initialization
+    /// </summary>
+    public static Logger Instance { get; } = new();
+    
+    // Set while the background writer runs; lines are queued here instead of written inline
+    private volatile Channel<string>? _queue;
+    private Task? _writerTask;
+    
+    // Timestamps have one-second resolution; lines logged within the same second share one string
+    private CachedTimestamp _timestamp = new(-1, "");
     
     private Logger() { }
     
-    public void Debug(string message) => Log(LogLevel.Debug, message);
-    public void Info(string message) => Log(LogLevel.Info, message);
-    public void Warn(string message) => Log(LogLevel.Warn, message);
-    public void Error(string message) => Log(LogLevel.Error, message);
+    /// <summary>
+    /// Checks whether messages at the given level are written; use it to skip building costly messages
+    /// </summary>
+    public bool IsEnabled(LogLevel level) => level >= MinLevel;
+    
+    public void Debug(string message) => Log(LogLevel.Debug, null, message);
+    public void Info(string message) => Log(LogLevel.Info, null, message);
+    public void Warn(string message) => Log(LogLevel.Warn, null, message);
+    public void Error(string message) => Log(LogLevel.Error, null, message);
     
     public void Debug(string category, string message) => Log(LogLevel.Debug, category, message);
     public void Info(string category, string message) => Log(LogLevel.Info, category, message);
     public void Warn(string category, string message) => Log(LogLevel.Warn, category, message);
     public void Error(string category, string message) => Log(LogLevel.Error, category, message);
     
-    private void Log(LogLevel level, string message)
+    /// <summary>
+    /// Moves console output to a background task so callers never block on the console; pair with FlushAsync
+    /// </summary>
+    public void StartBackgroundWriter()
+    {
+        if (_queue is not null) return;
+        
+        var queue = Channel.CreateUnbounded<string>(new UnboundedChannelOptions { SingleReader = true });
+        _writerTask = Task.Run(() => WriteQueuedLinesAsync(queue.Reader));
+        _queue = queue;
+    }
+    
+    /// <summary>
+    /// Writes any queued lines and returns to writing inline
+    /// </summary>
+    public async Task FlushAsync()
+    {
+        var queue = _queue;
+        if (queue is null) return;
+        
+        _queue = null;
+        queue.Writer.TryComplete();
+        await _writerTask!;
+    }
+    
+    private static async Task WriteQueuedLinesAsync(ChannelReader<string> reader)
+    {
+        await foreach (var line in reader.ReadAllAsync())
+        {
+            Console.WriteLine(line);
+        }
+    }
+    
+    private void Log(LogLevel level, string? category, string message)
     {
-        if (level < MinLevel) return;
+        if (!IsEnabled(level)) return;
+        
+        var timestamp = GetTimestamp();
+        var levelStr = GetLevelLabel(level);
+        var line = category is null
+            ? $"{timestamp} [{levelStr}] {message}"
+            : $"{timestamp} [{levelStr}] [{category}] {message}";
         
-        var timestamp = DateTime.Now.ToString("yyyy-MM-dd HH:mm:ss");
-        var levelStr = level.ToString().ToUpper();
-        Console.WriteLine($"{timestamp} [{levelStr}] {message}");
+        if (_queue?.Writer.TryWrite(line) == true) return;
+        
+        Console.WriteLine(line);
     }
     
-    private void Log(LogLevel level, string category, string message)
+    private string GetTimestamp()
     {
-        if (level < MinLevel) return;
+        var now = DateTime.Now;
+        var second = now.Ticks / TimeSpan.TicksPerSecond;
+        
+        // Read once: another thread may swap in a newer entry concurrently
+        var cached = _timestamp;
+        if (cached.Second == second)
+            return cached.Text;
         
-        var timestamp = DateTime.Now.ToString("yyyy-MM-dd HH:mm:ss");
-        var levelStr = level.ToString().ToUpper();
-        Console.WriteLine($"{timestamp} [{levelStr}] [{category}] {message}");
+        var text = now.ToString("yyyy-MM-dd HH:mm:ss");
+        _timestamp = new CachedTimestamp(second, text);
+        return text;
     }
+    
+    private sealed record CachedTimestamp(long Second, string Text);
+    
+    private static string GetLevelLabel(LogLevel level) => level switch
+    {
+        LogLevel.Debug => "DEBUG",
+        LogLevel.Info => "INFO",
+        LogLevel.Warn => "WARN",
+        LogLevel.Error => "ERROR",
+        _ => level.ToString().ToUpperInvariant()
+    };
 }